@@ -10,10 +10,13 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import json
+import os
 import secrets
+import socket
 import sqlite3
 import sys
-import time
+import threading
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -21,7 +24,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from src.db import DB_PATH
-from src.utils import BaseXMPPBot, get_xmpp_config, load_env
+from src.utils import BaseXMPPBot, get_dispatchers, get_xmpp_config, load_env
 
 
 class AskBot(BaseXMPPBot):
@@ -37,13 +40,13 @@ class AskBot(BaseXMPPBot):
     async def on_start(self, event):
         self.send_presence()
         self.send_reply(self.message)
-        await asyncio.sleep(1.5)
+        await self.drain_sends(timeout=2.0)
         self.disconnect()
 
 
 def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Delegate prompt to dispatcher")
-    parser.add_argument("prompt", nargs="+", help="prompt for delegated agent")
+    parser.add_argument("prompt", nargs="*", help="prompt for delegated agent")
     parser.add_argument(
         "--dispatcher",
         "-d",
@@ -62,6 +65,11 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default=1.0,
         help="sqlite polling interval in seconds",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run as a warm-connection daemon on SWITCH_ASK_AGENT_SOCKET",
+    )
     return parser.parse_args(argv)
 
 
@@ -72,64 +80,158 @@ def _default_dispatcher_name() -> str:
 
 
 def _open_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+    # Autocommit: this connection only reads. Each execute then sees the
+    # latest committed snapshot without needing commit() between polls.
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, cached_statements=32)
     conn.row_factory = sqlite3.Row
+
+    # Pragmas: the wait loops poll session_messages while dispatcher/session
+    # processes append to it. WAL lets those reads proceed concurrently with
+    # writes instead of serializing on the journal lock.
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+    except sqlite3.OperationalError:
+        # Best-effort; some environments may reject specific pragmas.
+        pass
     return conn
 
 
+class _DbChangeWatcher:
+    """Signal an asyncio.Event whenever another connection commits.
+
+    The stdlib sqlite3 module does not expose sqlite3_update_hook, so this
+    watches ``PRAGMA data_version`` (a per-connection counter that bumps when
+    any other connection commits) from a helper thread and wakes the event
+    loop via call_soon_threadsafe. Much cheaper than re-running the wait-loop
+    queries: the pragma reads a single header field, no parse/plan.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, check_interval: float = 0.05):
+        self.changed = asyncio.Event()
+        self._loop = loop
+        self._check_interval = check_interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        try:
+            conn = sqlite3.connect(DB_PATH)
+        except sqlite3.Error:
+            return
+        try:
+            last = conn.execute("PRAGMA data_version").fetchone()[0]
+            while not self._stop.wait(self._check_interval):
+                current = conn.execute("PRAGMA data_version").fetchone()[0]
+                if current != last:
+                    last = current
+                    self._loop.call_soon_threadsafe(self.changed.set)
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+    async def wait(self, timeout: float) -> None:
+        """Wait for a change notification, or fall back to a timed poll."""
+        try:
+            await asyncio.wait_for(self.changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.changed.clear()
+
+
+def _close_db(conn: sqlite3.Connection) -> None:
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.OperationalError:
+        pass
+    conn.close()
+
+
+# Hot-path SQL hoisted to a module constant so sqlite3's statement cache hits
+# on the same (interned) string every poll tick instead of re-parsing.
+#
+# One round-trip answers both wait-loop questions: which session picked up the
+# delegation token, and whether it has produced an assistant reply yet. Once
+# the caller knows the session it passes it back in, short-circuiting the
+# spawn CTE.
+_POLL_SQL = """
+    WITH spawn(session_name, id) AS (
+        SELECT m.session_name, m.id
+        FROM session_messages AS m
+        WHERE :session_name IS NULL
+          AND m.role = 'user'
+          AND m.id > :min_message_id
+          AND m.delegate_token = :token
+          AND EXISTS (
+              SELECT 1 FROM sessions AS s
+              WHERE s.name = m.session_name
+                AND s.status = 'active'
+                AND COALESCE(s.dispatcher_jid, '') = :dispatcher_jid
+          )
+        ORDER BY m.id DESC
+        LIMIT 1
+    ),
+    target(session_name, after_id) AS (
+        SELECT COALESCE(:session_name, (SELECT session_name FROM spawn)),
+               COALESCE(:after_id, (SELECT id FROM spawn))
+    )
+    SELECT t.session_name, t.after_id,
+           (SELECT m.content
+            FROM session_messages AS m
+            WHERE m.session_name = t.session_name
+              AND m.role = 'assistant'
+              AND m.id > t.after_id
+            ORDER BY m.id ASC
+            LIMIT 1) AS reply
+    FROM target AS t
+"""
+
+
 def _get_latest_message_id(conn: sqlite3.Connection) -> int:
-    row = conn.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM session_messages").fetchone()
-    if not row:
-        return 0
-    value = row["max_id"]
-    return int(value) if isinstance(value, (int, float)) else 0
+    # COALESCE(MAX(id), 0) on an INTEGER column always yields an integer.
+    return int(
+        conn.execute("SELECT COALESCE(MAX(id), 0) FROM session_messages").fetchone()[0]
+    )
 
 
-def _find_spawned_session_for_token(
+def _poll_delegation(
     conn: sqlite3.Connection,
     *,
     dispatcher_jid: str,
     token: str,
     min_message_id: int,
-) -> tuple[str, int] | None:
+    session_name: str | None,
+    after_id: int | None,
+) -> tuple[str | None, int | None, str | None]:
+    """One poll tick: returns (session_name, user_message_id, reply_content)."""
     row = conn.execute(
-        """
-        SELECT m.session_name, m.id
-        FROM session_messages AS m
-        JOIN sessions AS s ON s.name = m.session_name
-        WHERE m.role = 'user'
-          AND m.id > ?
-          AND instr(m.content, ?) > 0
-          AND s.status = 'active'
-          AND COALESCE(s.dispatcher_jid, '') = ?
-        ORDER BY m.id DESC
-        LIMIT 1
-        """,
-        (min_message_id, token, dispatcher_jid),
+        _POLL_SQL,
+        {
+            "dispatcher_jid": dispatcher_jid,
+            "token": token,
+            "min_message_id": min_message_id,
+            "session_name": session_name,
+            "after_id": after_id,
+        },
     ).fetchone()
-    if not row:
-        return None
-    return str(row["session_name"]), int(row["id"])
-
-
-def _find_assistant_reply(
-    conn: sqlite3.Connection, *, session_name: str, after_id: int
-) -> tuple[str, int] | None:
-    row = conn.execute(
-        """
-        SELECT content, id
-        FROM session_messages
-        WHERE session_name = ?
-          AND role = 'assistant'
-          AND id > ?
-        ORDER BY id ASC
-        LIMIT 1
-        """,
-        (session_name, after_id),
-    ).fetchone()
-    if not row:
-        return None
-    return str(row["content"] or ""), int(row["id"])
+    if not row or row["session_name"] is None:
+        return None, None, None
+    reply = row["reply"]
+    return (
+        str(row["session_name"]),
+        int(row["after_id"]),
+        str(reply) if reply is not None else None,
+    )
 
 
 async def _send_dispatcher_message(
@@ -140,16 +242,143 @@ async def _send_dispatcher_message(
     await asyncio.wait_for(bot.disconnected, timeout=10)
 
 
+def _ask_agent_socket_path() -> str:
+    return (os.getenv("SWITCH_ASK_AGENT_SOCKET") or "").strip()
+
+
+def _send_via_daemon(socket_path: str, dispatcher_name: str, body: str) -> bool:
+    """Hand the envelope to a warm-connection daemon over a local socket.
+
+    Returns False when no daemon is listening so the caller can fall back
+    to a one-shot XMPP connection.
+    """
+
+    payload = json.dumps({"dispatcher": dispatcher_name, "body": body}).encode()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.sendto(payload, socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+class _WarmBot(BaseXMPPBot):
+    """Long-lived dispatcher connection owned by the --serve daemon."""
+
+    def __init__(self, jid: str, password: str):
+        super().__init__(jid, password, recipient=jid)
+        self.add_event_handler("session_start", self.on_start)
+        self.add_event_handler("disconnected", self.on_disconnected)
+        self.add_event_handler("failed_auth", lambda event: None)
+
+    async def on_start(self, event):
+        self.send_presence()
+        self.set_connected(True)
+
+    def on_disconnected(self, event):
+        self.set_connected(False)
+
+
+async def serve(socket_path: str) -> int:
+    """Run as a sidecar daemon holding warm XMPP connections per dispatcher.
+
+    Repeated delegations skip the per-call TLS/SASL handshake (~1-2s) and
+    pay only a local datagram plus one stanza send.
+    """
+
+    load_env()
+    cfg = get_xmpp_config()
+    server = cfg["server"]
+    dispatchers = get_dispatchers()
+    bots: dict[str, _WarmBot] = {}
+    # The loop only holds tasks weakly; keep strong references so in-flight
+    # forwards can't be garbage-collected before delivering.
+    forward_tasks: set[asyncio.Task] = set()
+
+    def _forward_done(task: asyncio.Task) -> None:
+        forward_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"ask-agent daemon: forward failed: {task.exception()}", file=sys.stderr)
+
+    async def forward(dispatcher_name: str, body: str) -> None:
+        dispatcher = dispatchers.get(dispatcher_name)
+        if not dispatcher:
+            print(f"ask-agent daemon: unknown dispatcher '{dispatcher_name}'", file=sys.stderr)
+            return
+        jid = str(dispatcher.get("jid") or "").strip()
+        password = str(dispatcher.get("password") or "").strip()
+        if not jid or not password:
+            print(f"ask-agent daemon: dispatcher '{dispatcher_name}' not configured", file=sys.stderr)
+            return
+
+        bot = bots.get(jid)
+        if bot is None or not bot.is_connected():
+            if bot is not None:
+                # Tear down the stale client before replacing it.
+                bot.disconnect()
+            bot = _WarmBot(jid, password)
+            bot.connect_to_server(server)
+            bots[jid] = bot
+            if not await bot.wait_connected(timeout=10):
+                print(f"ask-agent daemon: connect timeout for {jid}", file=sys.stderr)
+                bots.pop(jid, None)
+                return
+        bot.send_reply(body)
+
+    class _Protocol(asyncio.DatagramProtocol):
+        def datagram_received(self, data: bytes, addr) -> None:
+            try:
+                payload = json.loads(data)
+            except ValueError:
+                return
+            dispatcher_name = str(payload.get("dispatcher") or "").strip()
+            body = str(payload.get("body") or "")
+            if dispatcher_name and body:
+                task = asyncio.get_running_loop().create_task(
+                    forward(dispatcher_name, body)
+                )
+                forward_tasks.add(task)
+                task.add_done_callback(_forward_done)
+
+    path = Path(socket_path)
+    path.unlink(missing_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(socket_path)
+    sock.setblocking(False)
+
+    loop = asyncio.get_running_loop()
+    transport, _protocol = await loop.create_datagram_endpoint(_Protocol, sock=sock)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        transport.close()
+        path.unlink(missing_ok=True)
+        for bot in bots.values():
+            bot.disconnect()
+    return 0
+
+
 async def main(argv: list[str]) -> int:
     args = _parse_args(argv)
 
     load_env()
+
+    if args.serve:
+        socket_path = _ask_agent_socket_path()
+        if not socket_path:
+            print("Error: --serve requires SWITCH_ASK_AGENT_SOCKET", file=sys.stderr)
+            return 2
+        return await serve(socket_path)
+
     cfg = get_xmpp_config()
 
     dispatcher_name = (args.dispatcher or _default_dispatcher_name()).strip()
-    dispatcher = cfg.get("dispatchers", {}).get(dispatcher_name)
+    dispatchers = get_dispatchers()
+    dispatcher = dispatchers.get(dispatcher_name)
     if not dispatcher:
-        known = ", ".join(sorted((cfg.get("dispatchers") or {}).keys())) or "none"
+        known = ", ".join(sorted(dispatchers.keys())) or "none"
         print(f"Error: unknown dispatcher '{dispatcher_name}'. Known: {known}", file=sys.stderr)
         return 2
 
@@ -176,54 +405,58 @@ async def main(argv: list[str]) -> int:
     )
 
     conn = _open_db()
+    watcher = _DbChangeWatcher(asyncio.get_running_loop())
+    watcher.start()
     try:
         min_message_id = _get_latest_message_id(conn)
-        await _send_dispatcher_message(
-            server=cfg["server"],
-            dispatcher_jid=dispatcher_jid,
-            dispatcher_password=dispatcher_password,
-            body=envelope,
-        )
 
-        deadline = time.monotonic() + max(5.0, float(args.timeout or 0.0))
-        session_name: str | None = None
-        user_message_id: int | None = None
-
-        while time.monotonic() < deadline:
-            conn.commit()
-            session_ref = _find_spawned_session_for_token(
-                conn,
+        # Prefer a warm-connection daemon (see --serve) when one is listening;
+        # otherwise pay the one-shot connect.
+        socket_path = _ask_agent_socket_path()
+        if not (socket_path and _send_via_daemon(socket_path, dispatcher_name, envelope)):
+            await _send_dispatcher_message(
+                server=cfg["server"],
                 dispatcher_jid=dispatcher_jid,
-                token=token,
-                min_message_id=min_message_id,
+                dispatcher_password=dispatcher_password,
+                body=envelope,
             )
-            if session_ref:
-                session_name, user_message_id = session_ref
-                break
-            await asyncio.sleep(max(0.1, float(args.poll_interval or 1.0)))
 
-        if not session_name or user_message_id is None:
+        session_name: str | None = None
+        user_message_id: int | None = None
+        interval = max(0.1, float(args.poll_interval or 1.0))
+
+        # One deadline timer around the whole wait instead of re-checking
+        # monotonic() every tick.
+        try:
+            async with asyncio.timeout(max(5.0, float(args.timeout or 0.0))):
+                while True:
+                    session_name, user_message_id, reply = _poll_delegation(
+                        conn,
+                        dispatcher_jid=dispatcher_jid,
+                        token=token,
+                        min_message_id=min_message_id,
+                        session_name=session_name,
+                        after_id=user_message_id,
+                    )
+                    if reply is not None:
+                        print(reply.strip())
+                        return 0
+                    await watcher.wait(interval)
+        except TimeoutError:
+            pass
+
+        if not session_name:
             print("Error: timed out waiting for delegated session creation", file=sys.stderr)
             return 3
 
-        while time.monotonic() < deadline:
-            conn.commit()
-            reply = _find_assistant_reply(
-                conn, session_name=session_name, after_id=user_message_id
-            )
-            if reply:
-                content, _reply_id = reply
-                print(content.strip())
-                return 0
-            await asyncio.sleep(max(0.1, float(args.poll_interval or 1.0)))
-
         print(
             f"Error: timed out waiting for delegated answer from {session_name}",
             file=sys.stderr,
         )
         return 4
     finally:
-        conn.close()
+        watcher.stop()
+        _close_db(conn)
 
 
 if __name__ == "__main__":
@@ -28,13 +28,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from src.utils import BaseXMPPBot, get_xmpp_config, load_env
-
-# Load environment
-load_env()
-cfg = get_xmpp_config()
-
-XMPP_SERVER = cfg["server"]
+from src.utils import BaseXMPPBot, get_dispatchers, get_xmpp_config, load_env
 
 
 def _default_dispatcher_name() -> str:
@@ -42,7 +36,7 @@ def _default_dispatcher_name() -> str:
     return (os.getenv("SWITCH_DEFAULT_DISPATCHER") or "oc-gpt").strip() or "oc-gpt"
 
 
-def _parse_args(argv: list[str]) -> tuple[str, str] | None:
+def _parse_args(argv: list[str]) -> tuple[str | None, str] | None:
     if not argv:
         return None
 
@@ -53,7 +47,9 @@ def _parse_args(argv: list[str]) -> tuple[str, str] | None:
     if argv[0] == "--list-dispatchers":
         return ("__list__", "")
 
-    dispatcher_name = _default_dispatcher_name()
+    # None means "use the default dispatcher"; resolved in main() after
+    # load_env() so SWITCH_DEFAULT_DISPATCHER from .env is honored.
+    dispatcher_name: str | None = None
 
     if argv[0].startswith("--dispatcher="):
         dispatcher_name = argv[0].split("=", 1)[1]
@@ -85,7 +81,7 @@ class SpawnBot(BaseXMPPBot):
         print(f"Sent to {self.recipient}")
         print(f"Message: {self.spawn_message[:100]}...")
 
-        await asyncio.sleep(2)
+        await self.drain_sends(timeout=2.0)
         self.disconnect()
 
 
@@ -100,7 +96,13 @@ async def main():
     if dispatcher_name == "__exit__":
         sys.exit(0)
 
-    dispatchers = cfg.get("dispatchers", {})
+    # Load environment/config lazily so importing this module stays free.
+    load_env()
+    if dispatcher_name is None:
+        dispatcher_name = _default_dispatcher_name()
+    cfg = get_xmpp_config()
+
+    dispatchers = get_dispatchers()
 
     if dispatcher_name == "__list__":
         known = "\n".join(f"- {name}" for name in sorted(dispatchers.keys())) or "(none)"
@@ -124,7 +126,7 @@ async def main():
         sys.exit(1)
 
     bot = SpawnBot(dispatcher_jid, dispatcher_password, dispatcher_jid, message)
-    bot.connect_to_server(XMPP_SERVER)
+    bot.connect_to_server(cfg["server"])
 
     try:
         await asyncio.wait_for(bot.disconnected, timeout=10)
@@ -1,7 +1,30 @@
-"""XMPP bots for the bridge."""
+"""XMPP bots for the bridge.
 
-from src.bots.dispatcher import DispatcherBot
-from src.bots.directory import DirectoryBot
-from src.bots.session import SessionBot
+Symbols are resolved lazily (PEP 562) so importing ``src.bots`` doesn't pull
+in the dispatcher/directory/session module trees unless a caller actually
+uses them.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.bots.directory import DirectoryBot
+    from src.bots.dispatcher import DispatcherBot
+    from src.bots.session import SessionBot
 
 __all__ = ["DispatcherBot", "DirectoryBot", "SessionBot"]
+
+_LAZY_IMPORTS = {
+    "DispatcherBot": "src.bots.dispatcher",
+    "DirectoryBot": "src.bots.directory",
+    "SessionBot": "src.bots.session",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
@@ -786,6 +786,12 @@ class SessionBot(BaseXMPPBot):
 
     async def peek_output(self, num_lines: int = 30):
         """Show recent output without adding to context."""
+        # The active runner buffers log writes; flush so the tail below shows
+        # current activity rather than whatever last hit the disk.
+        runner = self._runtime.runner
+        if runner is not None and self.processing:
+            runner.flush_log()
+
         output_file = self.output_dir / f"{self.session_name}.log"
         if not output_file.exists():
             self.send_reply("No output captured yet.")
@@ -25,7 +25,7 @@ from src.attachments.server import start_attachments_server
 from src.db import init_db
 from src.helpers import create_xmpp_account
 from src.manager import SessionManager
-from src.utils import get_xmpp_config, load_env
+from src.utils import get_xmpp_config, load_env, maybe_install_uvloop
 
 # Load environment
 load_env()
@@ -119,6 +119,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    if maybe_install_uvloop():
+        log.info("Using uvloop event loop")
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -43,7 +43,11 @@ class CommandHandler:
 
     def __init__(self, bot: "SessionBot"):
         self.bot = bot
-        self._commands: dict[str, tuple[Callable[..., Awaitable[bool]], bool]] = {}
+        # Precomputed dispatch: exact commands resolve via one dict lookup,
+        # prefix commands via a longest-first scan of a small sorted list
+        # (avoids overlaps like /ralph vs /ralph-look).
+        self._exact: dict[str, Callable[..., Awaitable[bool]]] = {}
+        self._prefix: list[tuple[str, Callable[..., Awaitable[bool]]]] = []
         self._discover_commands()
 
     def _discover_commands(self) -> None:
@@ -52,39 +56,46 @@ class CommandHandler:
             method = getattr(self, name)
             if callable(method) and hasattr(method, "_command_name"):
                 m = cast(Any, method)
-                cmd_name = cast(str, m._command_name)
                 exact = cast(bool, m._command_exact)
                 handler = cast(Callable[..., Awaitable[bool]], method)
-                self._commands[cmd_name] = (handler, exact)
-                for alias in cast(tuple[str, ...], m._command_aliases):
-                    self._commands[alias] = (handler, exact)
+                names = (cast(str, m._command_name),) + cast(
+                    tuple[str, ...], m._command_aliases
+                )
+                for cmd_name in names:
+                    if exact:
+                        self._exact[cmd_name] = handler
+                    else:
+                        self._prefix.append((cmd_name, handler))
+        self._prefix.sort(key=lambda item: len(item[0]), reverse=True)
 
     async def handle(self, body: str) -> bool:
         """Handle a command. Returns True if command was handled."""
-        cmd = body.strip().lower()
+        # Cheap gate before normalizing: handle() runs on every inbound
+        # message, and lowercasing a long chat body just to find out it isn't
+        # a command is wasted allocation.
+        lstripped = body.lstrip()
+        if not lstripped.startswith("/"):
+            return False
+
+        stripped = lstripped.rstrip()
+        cmd = stripped.lower()
 
         # Exact matches first.
-        for prefix, (handler, exact) in self._commands.items():
-            if exact and cmd == prefix:
-                return await handler(body)
-
-        # Then prefix matches, preferring the longest prefix (avoids overlaps like
-        # /ralph vs /ralph-look).
-        best: tuple[int, Callable[..., Awaitable[bool]]] | None = None
-        for prefix, (handler, exact) in self._commands.items():
-            if exact:
-                continue
+        handler = self._exact.get(cmd)
+        if handler is not None:
+            return await handler(stripped, [cmd])
+
+        # Then prefix matches; the list is sorted longest-first, so the first
+        # hit is the most specific one. Normalized tokens are split once here
+        # so handlers don't redo strip/lower/split on the same body.
+        for prefix, handler in self._prefix:
             if cmd.startswith(prefix):
-                score = len(prefix)
-                if best is None or score > best[0]:
-                    best = (score, handler)
-        if best is not None:
-            return await best[1](body)
+                return await handler(stripped, cmd.split())
 
         return False
 
     @command("/kill")
-    async def kill(self, _body: str) -> bool:
+    async def kill(self, _body: str, _parts: list[str]) -> bool:
         """Hard-kill the session (cancel work, close account, stop reconnect)."""
         # Send ack before we start teardown (account deletion can race delivery).
         self.bot.send_reply("Killing session (hard kill)...")
@@ -92,7 +103,7 @@ class CommandHandler:
         return True
 
     @command("/cancel")
-    async def cancel(self, _body: str) -> bool:
+    async def cancel(self, _body: str, _parts: list[str]) -> bool:
         """Cancel current operation."""
         cancelled = self.bot.cancel_operations(notify=False)
         if cancelled:
@@ -102,9 +113,8 @@ class CommandHandler:
         return True
 
     @command("/peek", exact=False)
-    async def peek(self, body: str) -> bool:
+    async def peek(self, _body: str, parts: list[str]) -> bool:
         """Show recent output."""
-        parts = body.strip().lower().split()
         num_lines = 30
         if len(parts) > 1:
             try:
@@ -115,9 +125,8 @@ class CommandHandler:
         return True
 
     @command("/agent", exact=False)
-    async def agent(self, body: str) -> bool:
+    async def agent(self, _body: str, parts: list[str]) -> bool:
         """Switch active engine."""
-        parts = body.strip().lower().split()
         if len(parts) < 2:
             self.bot.send_reply("Usage: /agent oc|cc")
             return True
@@ -132,9 +141,8 @@ class CommandHandler:
         return True
 
     @command("/thinking", exact=False)
-    async def thinking(self, body: str) -> bool:
+    async def thinking(self, _body: str, parts: list[str]) -> bool:
         """Set reasoning mode."""
-        parts = body.strip().lower().split()
         if len(parts) < 2 or parts[1] not in ("normal", "high"):
             self.bot.send_reply("Usage: /thinking normal|high")
             return True
@@ -154,9 +162,9 @@ class CommandHandler:
         return True
 
     @command("/model", exact=False)
-    async def model(self, body: str) -> bool:
+    async def model(self, body: str, _parts: list[str]) -> bool:
         """Set model ID."""
-        parts = body.strip().split(maxsplit=1)
+        parts = body.split(maxsplit=1)
         if len(parts) < 2 or not parts[1].strip():
             self.bot.send_reply("Usage: /model <model-id>")
             return True
@@ -167,7 +175,7 @@ class CommandHandler:
         return True
 
     @command("/reset")
-    async def reset(self, _body: str) -> bool:
+    async def reset(self, _body: str, _parts: list[str]) -> bool:
         """Reset session context."""
         session = self.bot.sessions.get(self.bot.session_name)
         if not session:
@@ -189,7 +197,7 @@ class CommandHandler:
         return True
 
     @command("/ralph-cancel", "/ralph-stop")
-    async def ralph_cancel(self, _body: str) -> bool:
+    async def ralph_cancel(self, _body: str, _parts: list[str]) -> bool:
         """Cancel Ralph loop."""
         if self.bot.session.request_ralph_stop():
             self.bot.send_reply("Ralph loop will stop after current iteration...")
@@ -199,7 +207,7 @@ class CommandHandler:
         return True
 
     @command("/ralph-status")
-    async def ralph_status(self, _body: str) -> bool:
+    async def ralph_status(self, _body: str, _parts: list[str]) -> bool:
         """Show Ralph loop status."""
         live = self.bot.session.get_ralph_status()
         if live and live.status in {"queued", "running", "stopping"}:
@@ -232,7 +240,7 @@ class CommandHandler:
         return True
 
     @command("/ralph", exact=False)
-    async def ralph(self, body: str) -> bool:
+    async def ralph(self, body: str, _parts: list[str]) -> bool:
         """Start a Ralph loop."""
         ralph_args = parse_ralph_command(body)
         if ralph_args is None:
@@ -327,14 +335,9 @@ class CommandHandler:
         return True
 
     @command("/ralph-look", "/ralphlook", exact=False)
-    async def ralph_look(self, body: str) -> bool:
+    async def ralph_look(self, body: str, parts: list[str]) -> bool:
         """Start a prompt-only Ralph loop (fresh context every iteration)."""
-        raw = body.strip()
-        low = raw.lower()
-        if low.startswith("/ralph-look"):
-            rest = raw[len("/ralph-look") :].strip()
-        else:
-            rest = raw[len("/ralphlook") :].strip()
+        rest = body[len(parts[0]) :].strip()
 
         if not rest:
             self.bot.send_reply(
@@ -344,4 +347,5 @@ class CommandHandler:
             return True
 
         # Delegate to /ralph with --look forced on.
-        return await self.ralph(f"/ralph {rest} --look")
+        forwarded = f"/ralph {rest} --look"
+        return await self.ralph(forwarded, forwarded.lower().split())
@@ -428,6 +428,8 @@ class SessionRuntime:
         if task and not task.done():
             task.cancel()
         self.cancel_queued()
+        if self.runner is not None:
+            self.runner.close_log()
 
     def answer_question(self, answer: object, *, request_id: str | None = None) -> bool:
         if not self._pending_question_answers:
@@ -439,6 +441,14 @@ class SessionRuntime:
             return True
         return False
 
+    def _set_runner(self, runner: Runner) -> Runner:
+        """Install a new runner, closing the previous one's log handle."""
+        old = self.runner
+        if old is not None:
+            old.close_log()
+        self.runner = runner
+        return runner
+
     def _set_processing(self, active: bool) -> None:
         self.processing = active
         self._emit_nowait(ProcessingChanged(active=active))
@@ -785,7 +795,7 @@ class SessionRuntime:
 
         if engine == "opencode":
             question_callback = self._create_question_callback()
-            self.runner = self._runner_factory.create(
+            runner = self._runner_factory.create(
                 "opencode",
                 working_dir=self.working_dir,
                 output_dir=self.output_dir,
@@ -798,12 +808,13 @@ class SessionRuntime:
                 ),
             )
         else:
-            self.runner = self._runner_factory.create(
+            runner = self._runner_factory.create(
                 "claude",
                 working_dir=self.working_dir,
                 output_dir=self.output_dir,
                 session_name=self.session_name,
             )
+        self._set_runner(runner)
 
         prompt = prompt_override or self._build_ralph_prompt(
             cfg, self._ralph_status.current_iteration if self._ralph_status else 1
@@ -883,6 +894,8 @@ class SessionRuntime:
         except Exception as e:
             result.error = f"{type(e).__name__}: {e}"
         finally:
+            if self.runner is not None:
+                self.runner.close_log()
             self.runner = None
         return result
 
@@ -898,11 +911,13 @@ class SessionRuntime:
         await self._emit(OutboundMessage(f"Unknown engine '{engine}'."))
 
     async def _run_claude(self, session: SessionState, prompt: str) -> None:
-        self.runner = self._runner_factory.create(
-            "claude",
-            working_dir=self.working_dir,
-            output_dir=self.output_dir,
-            session_name=self.session_name,
+        self._set_runner(
+            self._runner_factory.create(
+                "claude",
+                working_dir=self.working_dir,
+                output_dir=self.output_dir,
+                session_name=self.session_name,
+            )
         )
 
         response_parts: list[str] = []
@@ -941,17 +956,19 @@ class SessionRuntime:
 
     async def _run_opencode(self, session: SessionState, prompt: str) -> None:
         question_callback = self._create_question_callback()
-        self.runner = self._runner_factory.create(
-            "opencode",
-            working_dir=self.working_dir,
-            output_dir=self.output_dir,
-            session_name=self.session_name,
-            opencode_config=OpenCodeConfig(
-                model=session.model_id,
-                reasoning_mode=session.reasoning_mode,
-                agent=session.opencode_agent,
-                question_callback=question_callback,
-            ),
+        self._set_runner(
+            self._runner_factory.create(
+                "opencode",
+                working_dir=self.working_dir,
+                output_dir=self.output_dir,
+                session_name=self.session_name,
+                opencode_config=OpenCodeConfig(
+                    model=session.model_id,
+                    reasoning_mode=session.reasoning_mode,
+                    agent=session.opencode_agent,
+                    question_callback=question_callback,
+                ),
+            )
         )
 
         response_parts: list[str] = []
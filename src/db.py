@@ -10,6 +10,7 @@ Provides:
 
 from __future__ import annotations
 
+import re
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,6 +20,11 @@ from src.engines import OPENCODE_MODEL_DEFAULT, OPENCODE_MODEL_GPT
 
 DB_PATH = Path(__file__).parent.parent / "sessions.db"
 
+# Delegation envelopes (scripts/ask-agent.py) start with "[delegate_id:...]".
+# The token is extracted at insert time into an indexed column so waiters can
+# seek instead of instr()-scanning message content.
+DELEGATE_TOKEN_RE = re.compile(r"\[delegate_id:([^\]\s]+)\]")
+
 
 @dataclass
 class Session:
@@ -346,11 +352,23 @@ class MessageRepository:
         content: str,
         engine: str,
     ) -> None:
+        delegate_token = None
+        if role == "user":
+            match = DELEGATE_TOKEN_RE.search(content)
+            if match:
+                delegate_token = match.group(1)
         self.conn.execute(
             """INSERT INTO session_messages
-               (session_name, role, content, engine, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (session_name, role, content, engine, datetime.now().isoformat()),
+               (session_name, role, content, engine, created_at, delegate_token)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (
+                session_name,
+                role,
+                content,
+                engine,
+                datetime.now().isoformat(),
+                delegate_token,
+            ),
         )
         self.conn.commit()
 
@@ -434,6 +452,7 @@ def init_db() -> sqlite3.Connection:
             content TEXT NOT NULL,
             engine TEXT NOT NULL,
             created_at TEXT NOT NULL,
+            delegate_token TEXT,
             FOREIGN KEY (session_name) REFERENCES sessions(name)
         )
     """)
@@ -468,5 +487,43 @@ def init_db() -> sqlite3.Connection:
         except sqlite3.OperationalError:
             pass
 
+    message_migrations = [
+        ("delegate_token", "TEXT"),
+    ]
+    for col_name, col_type in message_migrations:
+        try:
+            conn.execute(
+                f"ALTER TABLE session_messages ADD COLUMN {col_name} {col_type}"
+            )
+            conn.commit()
+        except sqlite3.OperationalError:
+            pass
+
+    # Point lookups on active sessions (e.g. the ask-agent EXISTS probe)
+    # resolve within this small covering partial index. Created after the
+    # migrations above because dispatcher_jid is itself a migrated column.
+    conn.execute(
+        """CREATE INDEX IF NOT EXISTS idx_sessions_active_name
+           ON sessions(name, dispatcher_jid)
+           WHERE status = 'active'"""
+    )
+
+    # Partial index: only delegation envelopes carry a token, so this stays
+    # tiny while turning the ask-agent wait query into an index seek.
+    conn.execute(
+        """CREATE INDEX IF NOT EXISTS idx_session_messages_delegate_token
+           ON session_messages(delegate_token)
+           WHERE delegate_token IS NOT NULL"""
+    )
+
+    # Partial index aligned with the ask-agent reply wait
+    # (session_name = ? AND role = 'assistant' AND id > ? ORDER BY id):
+    # covers the seek and the ordering, and only holds assistant rows.
+    conn.execute(
+        """CREATE INDEX IF NOT EXISTS idx_session_messages_assistant
+           ON session_messages(session_name, id)
+           WHERE role = 'assistant'"""
+    )
+
     conn.commit()
     return conn
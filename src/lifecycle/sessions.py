@@ -186,14 +186,28 @@ async def kill_session(
     if not session or session.status == "closed":
         return session is not None
 
+    goodbye_task: asyncio.Task | None = None
     if send_goodbye:
         bot = manager.session_bots.get(name)
         if bot and bot.is_connected() and not bot.shutting_down:
-            try:
-                bot.send_reply(goodbye)
-                await asyncio.sleep(0.25)
-            except Exception:
-                pass
+
+            async def _send_goodbye_best_effort() -> None:
+                try:
+                    bot.send_reply(goodbye)
+                    # Wait for the stanza to actually hit the stream rather
+                    # than sleeping a guessed amount.
+                    await bot.drain_sends(timeout=2.0)
+                except Exception:
+                    pass
+
+            goodbye_task = asyncio.create_task(_send_goodbye_best_effort())
+
+    # tmux teardown is independent of goodbye delivery; overlap them so kill
+    # latency is the max of the branches, not the sum.
+    tmux_task = asyncio.create_task(asyncio.to_thread(kill_tmux_session, name))
+
+    if goodbye_task is not None:
+        await goodbye_task
 
     # If the bot is running, cancel in-flight work and prevent reconnects before we delete the account.
     bot = manager.session_bots.get(name)
@@ -205,14 +219,20 @@ async def kill_session(
         except Exception:
             pass
 
+    # Account deletion shells out to ejabberdctl; run it off-loop alongside
+    # the tmux kill so other sessions' lifecycle tasks don't stall behind it.
     username = session.xmpp_jid.split("@")[0]
-    delete_xmpp_account(
-        username,
-        manager.ejabberd_ctl,
-        manager.xmpp_domain,
-        getattr(bot, "log", None) or _log,
+    await asyncio.gather(
+        asyncio.to_thread(
+            delete_xmpp_account,
+            username,
+            manager.ejabberd_ctl,
+            manager.xmpp_domain,
+            getattr(bot, "log", None) or _log,
+        ),
+        tmux_task,
+        return_exceptions=True,
     )
-    kill_tmux_session(name)
     manager.sessions.close(name)
     manager.session_bots.pop(name, None)
 
@@ -1,10 +1,18 @@
-"""CLI runners for code agents."""
+"""CLI runners for code agents.
 
-from src.runners.claude import ClaudeRunner
-from src.runners.opencode import OpenCodeRunner, Question
-from src.runners.opencode.config import OpenCodeConfig
-from src.runners.ports import Runner, RunnerEvent
-from src.runners.registry import create_runner
+Symbols are resolved lazily (PEP 562) so importing ``src.runners`` doesn't
+pull in both engine trees (aiohttp, subprocess plumbing) unless a caller
+actually uses them.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.runners.claude import ClaudeRunner
+    from src.runners.opencode import OpenCodeRunner, Question
+    from src.runners.opencode.config import OpenCodeConfig
+    from src.runners.ports import Runner, RunnerEvent
+    from src.runners.registry import create_runner
 
 __all__ = [
     "ClaudeRunner",
@@ -15,3 +23,22 @@ __all__ = [
     "RunnerEvent",
     "create_runner",
 ]
+
+_LAZY_IMPORTS = {
+    "ClaudeRunner": "src.runners.claude",
+    "OpenCodeRunner": "src.runners.opencode",
+    "Question": "src.runners.opencode",
+    "OpenCodeConfig": "src.runners.opencode.config",
+    "Runner": "src.runners.ports",
+    "RunnerEvent": "src.runners.ports",
+    "create_runner": "src.runners.registry",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
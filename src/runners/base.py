@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -9,11 +10,13 @@ from pathlib import Path
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class RunState:
     """Accumulates state during a runner execution."""
 
-    start_time: datetime = field(default_factory=datetime.now)
+    # Monotonic start marker: duration only needs elapsed time, and
+    # time.monotonic() is far cheaper than building datetime objects.
+    start_mono: float = field(default_factory=time.monotonic)
     session_id: str | None = None
     text: str = ""
     tool_count: int = 0
@@ -48,7 +51,7 @@ class RunState:
 
     @property
     def duration_s(self) -> float:
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.monotonic() - self.start_mono
 
 
 class BaseRunner:
@@ -64,25 +67,59 @@ class BaseRunner:
         self.output_dir = output_dir
         self.session_name = session_name
         self.output_file: Path | None = None
+        self._log_fp = None
 
         if session_name:
             output_dir.mkdir(exist_ok=True)
             self.output_file = output_dir / f"{session_name}.log"
+            # One buffered append handle for the life of the runner instead of
+            # an open/write/close syscall triple per logged event.
+            self._log_fp = open(self.output_file, "ab", buffering=64 * 1024)
 
     def _log_to_file(self, content: str) -> None:
         """Append content to the output log file."""
-        if self.output_file:
-            with open(self.output_file, "a") as f:
-                f.write(content)
+        if self._log_fp is not None:
+            self._log_fp.write(content.encode("utf-8", errors="replace"))
+
+    def _flush_log(self) -> None:
+        """Push buffered log output to disk (run boundaries, cancellation)."""
+        if self._log_fp is not None:
+            try:
+                self._log_fp.flush()
+            except ValueError:
+                # Handle already closed.
+                pass
+
+    def flush_log(self) -> None:
+        """Make buffered log output visible to observers (e.g. /peek) mid-run."""
+        self._flush_log()
+
+    def close_log(self) -> None:
+        """Flush and close the log handle; safe to call more than once.
+
+        Runners are created per message, so without this the buffered handle
+        would only flush whenever the garbage collector finalizes it.
+        """
+        if self._log_fp is not None:
+            try:
+                self._log_fp.close()
+            except ValueError:
+                pass
+            self._log_fp = None
 
     def _log_prompt(self, prompt: str) -> None:
         """Log the prompt to the output file."""
         self._log_to_file(
             f"\n[{datetime.now().strftime('%H:%M:%S')}] Prompt: {prompt}\n"
         )
+        # Runs can stream for minutes; land the prompt right away so /peek
+        # shows what the runner is working on.
+        self._flush_log()
 
     def _log_response(self, text: str) -> None:
         """Log a response to the output file."""
         self._log_to_file(
             f"\n[{datetime.now().strftime('%H:%M:%S')}] Response:\n{text}\n"
         )
+        # Responses mark a user-visible boundary (e.g. /peek); make them land.
+        self._flush_log()
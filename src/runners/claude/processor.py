@@ -7,8 +7,7 @@ Separates parsing/logging concerns from the subprocess orchestration in
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 from src.runners.base import RunState
 from src.runners.ports import RunnerEvent
@@ -19,7 +18,7 @@ from src.runners.tool_logging import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeResult:
     """Final result from a Claude run."""
 
@@ -112,7 +111,8 @@ class ClaudeEventProcessor:
             path = ""
             if isinstance(tool_input, dict):
                 path = str(tool_input.get("file_path", "") or "")
-            leaf = Path(path).name if path else ""
+            # CLI paths are POSIX-style; a string split beats building a PurePath.
+            leaf = path.rpartition("/")[2] if path else ""
             if leaf:
                 extra_bits = [leaf] + extra_bits
             extra = " | ".join(extra_bits)
@@ -135,8 +135,7 @@ class ClaudeEventProcessor:
         self._log_to_file(f"{desc}\n")
         return ("tool", desc)
 
-    def _handle_assistant(self, event: dict, state: RunState) -> list[Event]:
-        events: list[Event] = []
+    def _handle_assistant(self, event: dict, state: RunState) -> Iterator[Event]:
         content = event.get("message", {}).get("content", [])
 
         for block in content:
@@ -144,13 +143,11 @@ class ClaudeEventProcessor:
             if block_type == "text":
                 result = self._handle_assistant_text(block, state)
                 if result:
-                    events.append(result)
+                    yield result
             elif block_type == "tool_use":
                 result = self._handle_assistant_tool(block, state)
                 if result:
-                    events.append(result)
-
-        return events
+                    yield result
 
     def _handle_result(self, event: dict, state: RunState) -> Event:
         state.saw_result = True
@@ -173,10 +170,13 @@ class ClaudeEventProcessor:
 
         context_window = 200000
         model_name = "claude"
-        for name, model_data in event.get("modelUsage", {}).items():
-            model_name = name
-            context_window = model_data.get("contextWindow", context_window)
-            break
+        model_usage = event.get("modelUsage")
+        if model_usage:
+            # Typically a single entry; grab the first directly.
+            model_name = next(iter(model_usage))
+            context_window = model_usage[model_name].get(
+                "contextWindow", context_window
+            )
 
         tokens_k = total_tokens / 1000
         context_k = context_window / 1000
@@ -200,15 +200,24 @@ class ClaudeEventProcessor:
 
         return ("result", payload)
 
-    def parse_event(self, event: dict, state: RunState) -> list[Event]:
-        event_type = event.get("type")
-
-        if event_type == "system":
-            result = self._handle_system_init(event, state)
-            return [result] if result else []
-        if event_type == "assistant":
-            return self._handle_assistant(event, state)
-        if event_type == "result":
-            return [self._handle_result(event, state)]
-
-        return []
+    def _handle_system(self, event: dict, state: RunState) -> Iterator[Event]:
+        result = self._handle_system_init(event, state)
+        if result:
+            yield result
+
+    def _handle_result_event(self, event: dict, state: RunState) -> Iterator[Event]:
+        yield self._handle_result(event, state)
+
+    # Class-level dispatch: one dict lookup per event.
+    _HANDLERS: dict[str, Callable] = {
+        "system": _handle_system,
+        "assistant": _handle_assistant,
+        "result": _handle_result_event,
+    }
+
+    def parse_event(self, event: dict, state: RunState) -> Iterator[Event]:
+        """Yield events parsed from one stream-json line (lazily, no list)."""
+        handler = self._HANDLERS.get(event.get("type"))
+        if handler is None:
+            return iter(())
+        return handler(self, event, state)
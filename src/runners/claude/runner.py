@@ -11,7 +11,7 @@ from typing import AsyncIterator
 from src.runners.base import BaseRunner, RunState
 from src.runners.claude.processor import ClaudeEventProcessor
 from src.runners.pipeline import JSONLineStats, iter_json_line_pipeline
-from src.runners.subprocess_transport import SubprocessTransport
+from src.runners.subprocess_transport import SubprocessTransport, iter_stdout_lines
 from src.runners.ports import RunnerEvent
 
 log = logging.getLogger("claude")
@@ -124,7 +124,7 @@ class ClaudeRunner(BaseRunner):
 
                 stats = JSONLineStats()
                 async for result in iter_json_line_pipeline(
-                    byte_stream=stdout,
+                    byte_stream=iter_stdout_lines(stdout),
                     state=state,
                     parse_event=self._processor.parse_event,
                     stats=stats,
@@ -135,6 +135,7 @@ class ClaudeRunner(BaseRunner):
                 non_json_lines = stats.non_json_lines
 
                 returncode = await self._transport.wait()
+                self._flush_log()
 
                 # If we got no structured events and the process failed, this is
                 # often a CLI flag mismatch. Retry with the next arg variant.
@@ -164,3 +165,4 @@ class ClaudeRunner(BaseRunner):
     def cancel(self) -> None:
         """Terminate the running process."""
         self._transport.cancel()
+        self._flush_log()
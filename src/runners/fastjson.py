@@ -0,0 +1,16 @@
+"""JSON decoding for runner hot paths.
+
+Uses orjson when available (2-6x faster on the small per-line event payloads
+the runners parse) and falls back to the stdlib. Both accept ``bytes`` or
+``str`` and raise a ``ValueError`` subclass on invalid input, so callers
+should catch ``ValueError``.
+"""
+
+from __future__ import annotations
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads"]
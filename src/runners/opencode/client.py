@@ -9,6 +9,7 @@ import os
 from typing import Callable
 
 import aiohttp
+from src.runners.fastjson import loads as _loads
 from src.runners.opencode.errors import OpenCodeHTTPError, OpenCodeProtocolError
 from src.runners.opencode.models import Question
 
@@ -180,19 +181,26 @@ class OpenCodeClient:
         session_id: str,
         *,
         timeout_s: float = 30.0,
-        interval_s: float = 0.5,
+        interval_s: float = 0.1,
+        max_interval_s: float = 5.0,
     ) -> str | None:
         """Fallback for when SSE doesn't deliver text events.
 
-        Polls the session's stored messages until an assistant message appears.
+        Polls the session's stored messages until an assistant message
+        appears, backing off exponentially from ``interval_s`` up to
+        ``max_interval_s`` so a fast server answers quickly while a slow one
+        isn't hammered at a fixed rate.
         """
-        deadline = asyncio.get_event_loop().time() + timeout_s
-        while asyncio.get_event_loop().time() < deadline:
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout_s
+        delay = interval_s
+        while loop.time() < deadline:
             messages = await self.get_session_messages(session, session_id)
             text = self._extract_assistant_text(messages)
             if text:
                 return text
-            await asyncio.sleep(interval_s)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_interval_s)
         return None
 
     async def stream_events(
@@ -292,22 +300,30 @@ class OpenCodeClient:
                 if not event_bytes.strip():
                     continue
 
-                data_lines: list[str] = []
-                for raw_line in event_bytes.splitlines():
-                    line = raw_line.decode("utf-8", errors="replace").rstrip("\r")
-                    if not line or line.startswith(":"):
+                # Stay in bytes: the JSON parser takes bytes directly, so
+                # field filtering and joining never pay for a str decode.
+                data_lines: list[bytes] = []
+                for line in event_bytes.splitlines():
+                    if not line or line.startswith(b":"):
                         continue
-                    if line.startswith("data:"):
-                        data_lines.append(line[len("data:") :].lstrip())
+                    if line.startswith(b"data:"):
+                        data_lines.append(line[len(b"data:") :].lstrip())
 
                 if not data_lines:
                     continue
 
-                payload = "\n".join(data_lines)
+                if len(data_lines) == 1:
+                    payload = data_lines[0]
+                else:
+                    payload = b"\n".join(data_lines)
                 try:
-                    event = json.loads(payload)
-                except json.JSONDecodeError as e:
-                    preview = payload.strip().replace("\n", " ")[:2000]
+                    event = _loads(payload)
+                except ValueError as e:
+                    preview = (
+                        payload.decode("utf-8", errors="replace")
+                        .strip()
+                        .replace("\n", " ")[:2000]
+                    )
                     raise OpenCodeProtocolError(
                         "Invalid JSON in SSE data field",
                         payload_preview=preview,
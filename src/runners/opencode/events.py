@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import sys
+
 
 def _find_session_id_in_dict(d: dict) -> str | None:
     """Check a dict for sessionID/sessionId/session_id keys."""
     for key in ("sessionID", "sessionId", "session_id"):
         value = d.get(key)
         if isinstance(value, str) and value:
-            return value
+            # Interned so the pipeline's per-event comparison against the
+            # (also interned) run session ID hits the identity fast path.
+            return sys.intern(value)
     return None
 
 
@@ -54,6 +58,11 @@ def extract_session_id(payload: dict) -> str | None:
     return None
 
 
+# Event types whose handlers read payload["part"]; coerce_event guarantees a
+# dict part for these so the handlers don't have to re-check per event.
+_PART_EVENT_TYPES = {"text", "tool_use", "tool_result", "tool-result", "step_finish"}
+
+
 def coerce_event(payload: dict) -> dict | None:
     # OpenCode GlobalBus SSE wraps events as:
     # {"directory": "...", "payload": {"type": "...", "properties": {...}}}
@@ -63,17 +72,20 @@ def coerce_event(payload: dict) -> dict | None:
         payload = inner
 
     if "type" in payload and "part" in payload:
-        return payload
+        if isinstance(payload["part"], dict):
+            return payload
+        if payload.get("type") in _PART_EVENT_TYPES:
+            return None
+        # Non-part event carrying a malformed part; normalize below.
 
     event_type = payload.get("type")
     if not isinstance(event_type, str):
         return None
 
-    props = (
-        payload.get("properties")
-        if isinstance(payload.get("properties"), dict)
-        else None
-    )
+    # Single hash lookup; everything below reads the cached local.
+    props = payload.get("properties")
+    if not isinstance(props, dict):
+        props = None
 
     if props:
         # OpenCode server mode tends to emit message events instead of raw "text"
@@ -134,6 +146,10 @@ def coerce_event(payload: dict) -> dict | None:
         "tool-result",
         "error",
     }:
+        if event_type in _PART_EVENT_TYPES and not isinstance(
+            payload.get("part"), dict
+        ):
+            return None
         if event_type == "tool-result":
             payload = dict(payload)
             payload["type"] = "tool_result"
@@ -22,6 +22,25 @@ from src.runners.tool_logging import (
 )
 
 
+def _question_fields(event: dict) -> tuple[object, list]:
+    """Extract the request id and question list from a question event.
+
+    Checks top-level keys first and only touches properties when needed,
+    without materializing default dicts along the way.
+    """
+
+    request_id = event.get("requestID") or event.get("id")
+    questions = event.get("questions")
+    if request_id and questions:
+        return request_id, questions
+
+    props = event.get("properties")
+    if isinstance(props, dict):
+        request_id = request_id or props.get("requestID") or props.get("id")
+        questions = questions or props.get("questions")
+    return request_id, questions or []
+
+
 class OpenCodeEventProcessor:
     def __init__(
         self,
@@ -36,7 +55,8 @@ class OpenCodeEventProcessor:
 
     def _handle_step_start(self, event: dict, state: RunState) -> Event | None:
         session_id = event.get("sessionID")
-        if isinstance(session_id, str) and session_id:
+        # JSON values are exact builtin types; type(x) is str skips the MRO walk.
+        if session_id and type(session_id) is str:
             state.session_id = session_id
             return ("session_id", session_id)
         return None
@@ -57,9 +77,9 @@ class OpenCodeEventProcessor:
         return ("text", text)
 
     def _handle_text(self, event: dict, state: RunState) -> Event | None:
-        part = event.get("part", {})
-        text = part.get("text", "") if isinstance(part, dict) else ""
-        if isinstance(text, str):
+        # coerce_event guarantees part is a dict for part-carrying events.
+        text = event["part"].get("text", "")
+        if type(text) is str:
             return self._apply_text_update(text, state)
         return None
 
@@ -76,9 +96,7 @@ class OpenCodeEventProcessor:
         return None
 
     def _handle_tool_use(self, event: dict, state: RunState) -> Event | None:
-        part = event.get("part", {})
-        if not isinstance(part, dict):
-            return None
+        part = event["part"]
 
         tool = part.get("tool")
         if not tool:
@@ -252,9 +270,7 @@ class OpenCodeEventProcessor:
         return ("tool", desc)
 
     def _handle_tool_result(self, event: dict, state: RunState) -> Event | None:
-        part = event.get("part", {})
-        if not isinstance(part, dict):
-            return None
+        part = event["part"]
 
         tool = part.get("tool") or part.get("name") or "tool"
         tool_str = str(tool)
@@ -322,22 +338,28 @@ class OpenCodeEventProcessor:
         self._log_to_file(f"{desc}\n")
         return ("tool_result", desc)
 
-    def _handle_step_finish(self, event: dict, state: RunState) -> Event | None:
-        part = event.get("part", {})
-        if not isinstance(part, dict):
-            return None
-
-        tokens = part.get("tokens", {})
-        if isinstance(tokens, dict):
-            cache = tokens.get("cache", {})
-            state.tokens_in += int(tokens.get("input", 0) or 0)
-            state.tokens_out += int(tokens.get("output", 0) or 0)
-            state.tokens_reasoning += int(tokens.get("reasoning", 0) or 0)
-            if isinstance(cache, dict):
-                state.tokens_cache_read += int(cache.get("read", 0) or 0)
-                state.tokens_cache_write += int(cache.get("write", 0) or 0)
-
-        state.cost += float(part.get("cost", 0) or 0)
+    def _handle_step_finish(
+        self,
+        event: dict,
+        state: RunState,
+        _float=float,
+        _isinstance=isinstance,
+    ) -> Event | None:
+        part = event["part"]
+
+        tokens = part.get("tokens")
+        if _isinstance(tokens, dict):
+            # JSON already decodes counts as ints; `or 0` covers missing/null
+            # without paying an int() call per field.
+            state.tokens_in += tokens.get("input") or 0
+            state.tokens_out += tokens.get("output") or 0
+            state.tokens_reasoning += tokens.get("reasoning") or 0
+            cache = tokens.get("cache")
+            if _isinstance(cache, dict):
+                state.tokens_cache_read += cache.get("read") or 0
+                state.tokens_cache_write += cache.get("write") or 0
+
+        state.cost += _float(part.get("cost") or 0)
 
         if part.get("reason") == "stop":
             state.saw_result = True
@@ -355,16 +377,7 @@ class OpenCodeEventProcessor:
         return ("error", str(message or error or "OpenCode error"))
 
     def _handle_question(self, event: dict, state: RunState) -> Event | None:
-        request_id = (
-            event.get("requestID")
-            or event.get("id")
-            or event.get("properties", {}).get("requestID")
-            or event.get("properties", {}).get("id")
-        )
-
-        questions = (
-            event.get("questions") or event.get("properties", {}).get("questions") or []
-        )
+        request_id, questions = _question_fields(event)
 
         if not request_id:
             self._log_to_file(f"Question event missing request ID: {event}\n")
@@ -414,11 +427,14 @@ class OpenCodeEventProcessor:
             parts = raw_parts
 
         if not state.text and parts:
-            for part in parts:
-                if isinstance(part, dict) and part.get("type") == "text":
-                    text = part.get("text", "")
-                    if isinstance(text, str):
-                        state.text += text
+            # Join once rather than growing the string part by part.
+            state.text = "".join(
+                text
+                for part in parts
+                if isinstance(part, dict) and part.get("type") == "text"
+                for text in (part.get("text", ""),)
+                if isinstance(text, str)
+            )
 
         if state.tokens_in == 0 and state.tokens_out == 0:
             usage = info.get("tokens") or info.get("usage") or {}
@@ -440,6 +456,37 @@ class OpenCodeEventProcessor:
             return ("error", f"OpenCode output (non-JSON): {preview}")
         return ("error", "OpenCode exited without output")
 
+    def _handle_message_part(self, event: dict, state: RunState) -> Event | None:
+        # Server-mode streams often send message events rather than "text".
+        message_id = event.get("messageID")
+        role = (
+            state.message_roles.get(message_id)
+            if isinstance(message_id, str) and message_id
+            else None
+        )
+        if role != "assistant":
+            return None
+
+        text = event.get("text", "")
+        if type(text) is str:
+            return self._apply_text_update(text, state)
+        return None
+
+    # Class-level dispatch: one dict lookup per event instead of walking an
+    # if/elif chain for every stream event.
+    _HANDLERS: dict[str, Callable] = {
+        "step_start": _handle_step_start,
+        "text": _handle_text,
+        "tool_use": _handle_tool_use,
+        "tool_result": _handle_tool_result,
+        "step_finish": _handle_step_finish,
+        "error": _handle_error,
+        "question.asked": _handle_question,
+        "question": _handle_question,
+        "message_meta": _handle_message_meta,
+        "message_part": _handle_message_part,
+    }
+
     def parse_event(self, raw_event: dict, state: RunState) -> Event | None:
         event = coerce_event(raw_event)
         if not event:
@@ -449,36 +496,11 @@ class OpenCodeEventProcessor:
         if not isinstance(event_type, str):
             return None
 
-        if event_type == "step_start":
-            return self._handle_step_start(event, state)
+        # Fast path for the event type that dominates any streaming run.
         if event_type == "text":
             return self._handle_text(event, state)
-        if event_type == "tool_use":
-            return self._handle_tool_use(event, state)
-        if event_type == "tool_result":
-            return self._handle_tool_result(event, state)
-        if event_type == "step_finish":
-            return self._handle_step_finish(event, state)
-        if event_type == "error":
-            return self._handle_error(event, state)
-        if event_type in {"question.asked", "question"}:
-            return self._handle_question(event, state)
-        if event_type == "message_meta":
-            return self._handle_message_meta(event, state)
 
-        # Server-mode streams often send message events rather than "text".
-        if event_type == "message_part":
-            message_id = event.get("messageID")
-            role = (
-                state.message_roles.get(message_id)
-                if isinstance(message_id, str) and message_id
-                else None
-            )
-            if role != "assistant":
-                return None
-
-            text = event.get("text", "")
-            if isinstance(text, str):
-                return self._apply_text_update(text, state)
-
-        return None
+        handler = self._HANDLERS.get(event_type)
+        if handler is None:
+            return None
+        return handler(self, event, state)
@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import socket
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import AsyncIterator
 
 import aiohttp
@@ -63,11 +65,13 @@ class _CallbackQuestionHandler(_QuestionHandler):
         callback_task = asyncio.create_task(self._callback(question))
         answered = False
         try:
+            # Wake when the callback finishes; the timeout only bounds how long
+            # a cancellation request can go unnoticed.
             while not callback_task.done():
                 if cancelled():
                     callback_task.cancel()
                     raise asyncio.CancelledError()
-                await asyncio.sleep(0.1)
+                await asyncio.wait({callback_task}, timeout=0.25)
             answers = callback_task.result()
             await client.answer_question(session, question, answers)
             answered = True
@@ -101,6 +105,8 @@ class OpenCodeRunner(BaseRunner):
             model=self._config.model,
         )
         self._transport = OpenCodeTransport(self._client)
+        # Static per instance; no need to re-derive for every run.
+        self._model_payload = self._build_model_payload()
 
         self._question_handler: _QuestionHandler
         if self._config.question_callback:
@@ -110,6 +116,19 @@ class OpenCodeRunner(BaseRunner):
         else:
             self._question_handler = _RejectQuestionHandler()
 
+    def _build_connector(self) -> aiohttp.TCPConnector:
+        """Connector tuned for the single embedded server this runner talks to."""
+        host = urlsplit(self._client.server_url).hostname
+        # Loopback targets can skip IPv6 resolution attempts entirely.
+        family = socket.AF_INET if host in {"127.0.0.1", "localhost"} else 0
+        return aiohttp.TCPConnector(
+            limit=4,
+            limit_per_host=4,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+            family=family,
+        )
+
     def _build_model_payload(self) -> dict | None:
         if not self._config.model:
             return None
@@ -153,12 +172,18 @@ class OpenCodeRunner(BaseRunner):
 
         sse_task: asyncio.Task | None = None
         message_task: asyncio.Task | None = None
-        event_queue: asyncio.Queue[dict] = asyncio.Queue()
+        # Bounded so a stalled consumer (e.g. a long question callback)
+        # backpressures the SSE reader instead of buffering without limit.
+        event_queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=256)
 
         try:
             async with aiohttp.ClientSession(
                 auth=self._client.auth,
                 timeout=build_http_timeout(total_s=self._config.http_timeout_s),
+                # All traffic goes to one loopback server; a small keepalive
+                # pool means the SSE stream, message POST and question replies
+                # reuse connections instead of re-handshaking per request.
+                connector=self._build_connector(),
             ) as session:
                 session_id = await self._transport.start_session(
                     session,
@@ -172,7 +197,7 @@ class OpenCodeRunner(BaseRunner):
                     session,
                     session_id=session_id,
                     prompt=prompt,
-                    model_payload=self._build_model_payload(),
+                    model_payload=self._model_payload,
                     agent=self._config.agent,
                     reasoning_mode=self._config.reasoning_mode,
                     event_queue=event_queue,
@@ -227,10 +252,12 @@ class OpenCodeRunner(BaseRunner):
                     yield ("result", result)
         finally:
             await self._transport.cleanup(sse_task=sse_task, message_task=message_task)
+            self._flush_log()
 
     def cancel(self) -> None:
         """Request cancellation of the running session."""
         self._transport.cancel()
+        self._flush_log()
 
     async def wait_cancelled(self) -> None:
         """Wait for cancellation cleanup to complete."""
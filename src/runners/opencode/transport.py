@@ -132,15 +132,21 @@ class OpenCodeTransport:
 
         self._cancelled = True
 
+        # Cancel both tasks before awaiting either so teardown needs one
+        # scheduler pass instead of two sequential cancel/await round trips.
+        cancel_message = message_task is not None and not message_task.done()
         if sse_task:
             sse_task.cancel()
+        if cancel_message:
+            message_task.cancel()
+
+        if sse_task:
             try:
                 await sse_task
             except asyncio.CancelledError:
                 pass
 
-        if message_task and not message_task.done():
-            message_task.cancel()
+        if cancel_message:
             try:
                 await message_task
             except asyncio.CancelledError:
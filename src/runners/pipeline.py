@@ -14,18 +14,18 @@ Engines supply:
 from __future__ import annotations
 
 import asyncio
-import json
-import time
+import sys
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Awaitable, Callable, TypeVar
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
 
 from src.runners.base import RunState
+from src.runners.fastjson import loads as _loads
 
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONLineStats:
     emitted_any: bool = False
     non_json_lines: list[str] = field(default_factory=list)
@@ -46,90 +46,189 @@ async def iter_queue_pipeline(
     is_question: Callable[[T], bool] | None = None,
     handle_question: Callable[[T], Awaitable[None]] | None = None,
 ) -> AsyncIterator[T]:
-    """Drive a queue-based runner until completion."""
-
-    message_done_at: float | None = None
-    last_event_at = time.monotonic()
-
-    while True:
-        if should_cancel():
-            break
-
-        if sse_task.done() and not sse_task.cancelled():
-            exc = sse_task.exception()
-            if exc:
-                raise exc
-
-        if message_task.done() and is_done(state):
-            break
-
-        if message_task.done() and message_done_at is None:
-            message_done_at = time.monotonic()
-
-        if message_done_at is not None and not is_done(state):
-            if (time.monotonic() - last_event_at) >= idle_timeout_s:
+    """Drive a queue-based runner until completion.
+
+    Waits are event-driven: the loop sleeps on the queue getter alongside the
+    SSE/message tasks with FIRST_COMPLETED instead of waking on a fixed tick,
+    so busy streams pay no timeout bookkeeping and completion is detected the
+    moment a task finishes. The idle timeout only arms once the message POST
+    has completed, as a bounded wait on that final stretch.
+
+    Consecutive ``("text", str)`` events are coalesced while the queue has a
+    backlog: token-sized updates arrive far faster than consumers need them,
+    and each yield is a suspend/resume on both sides. The buffer is flushed
+    whenever the queue drains (so coalescing never adds latency), when any
+    non-text event arrives, when it reaches ~1KB, and at stream end.
+    """
+
+    # Engines intern the IDs they extract from raw events; interning ours too
+    # turns the per-event session filter into an identity fast path inside
+    # str.__eq__ rather than a character compare.
+    session_id = sys.intern(session_id)
+
+    pending_text: list[str] = []
+    pending_len = 0
+    get_task: asyncio.Task | None = None
+    batch: list[object] = []
+    # Bound on how many backlogged events one pass drains synchronously, so
+    # cancellation and completion checks still run at a reasonable cadence.
+    max_batch = 32
+    # Question support is fixed for the run; decide once instead of testing
+    # both callables for every emitted token.
+    check_question = is_question if (is_question and handle_question) else None
+
+    try:
+        while True:
+            if should_cancel():
                 break
 
-        try:
-            payload = await asyncio.wait_for(event_queue.get(), timeout=0.25)
-        except asyncio.TimeoutError:
-            continue
+            if sse_task.done() and not sse_task.cancelled():
+                exc = sse_task.exception()
+                if exc:
+                    raise exc
 
-        if not isinstance(payload, dict):
-            continue
-
-        payload_session = extract_session_id(payload)
-        if payload_session and payload_session != session_id:
-            continue
-
-        parsed = parse_event(payload, state)
-        if not parsed:
-            continue
-
-        items: list[T]
-        if isinstance(parsed, list):
-            items = parsed
-        else:
-            items = [parsed]
-
-        if not items:
-            continue
-
-        last_event_at = time.monotonic()
+            if message_task.done() and is_done(state):
+                break
 
-        for item in items:
-            if is_question and handle_question and is_question(item):
-                yield item
-                await handle_question(item)
-            else:
-                yield item
+            if get_task is None:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    pass
+
+            if not batch:
+                # Queue drained: flush coalesced text before blocking.
+                if pending_text:
+                    yield ("text", "".join(pending_text))
+                    pending_text.clear()
+                    pending_len = 0
+
+                if get_task is None:
+                    get_task = asyncio.ensure_future(event_queue.get())
+                if not get_task.done():
+                    waiters = {get_task}
+                    if not sse_task.done():
+                        waiters.add(sse_task)
+                    if not message_task.done():
+                        waiters.add(message_task)
+                    done, _ = await asyncio.wait(
+                        waiters,
+                        timeout=idle_timeout_s if message_task.done() else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        # No event within the post-message idle window.
+                        break
+                    if get_task not in done:
+                        continue
+                batch.append(get_task.result())
+                get_task = None
+
+            # Burst streams put events faster than we consume them; drain the
+            # backlog in one synchronous pass instead of paying the top-of-loop
+            # bookkeeping per event.
+            while len(batch) < max_batch:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for payload in batch:
+                if not isinstance(payload, dict):
+                    continue
+
+                payload_session = extract_session_id(payload)
+                if payload_session and payload_session != session_id:
+                    continue
+
+                parsed = parse_event(payload, state)
+                if not parsed:
+                    continue
+
+                items: Iterable[T]
+                if isinstance(parsed, list):
+                    items = parsed
+                else:
+                    # Single event is the common case; a tuple wrapper is
+                    # cheaper than a one-element list per streamed token.
+                    items = (parsed,)
+
+                for item in items:
+                    if (
+                        type(item) is tuple
+                        and item[0] == "text"
+                        and type(item[1]) is str
+                    ):
+                        pending_text.append(item[1])
+                        pending_len += len(item[1])
+                        if pending_len >= 1024:
+                            yield ("text", "".join(pending_text))
+                            pending_text.clear()
+                            pending_len = 0
+                        continue
+
+                    if pending_text:
+                        yield ("text", "".join(pending_text))
+                        pending_text.clear()
+                        pending_len = 0
+
+                    if check_question is not None and check_question(item):
+                        yield item
+                        await handle_question(item)
+                    else:
+                        yield item
+
+            batch.clear()
+    finally:
+        if get_task is not None:
+            get_task.cancel()
+
+    if pending_text:
+        yield ("text", "".join(pending_text))
 
 
 async def iter_json_line_pipeline(
     *,
     byte_stream: AsyncIterator[bytes],
     state: RunState,
-    parse_event: Callable[[dict, RunState], list[T]],
+    parse_event: Callable[[dict, RunState], Iterable[T]],
     stats: JSONLineStats,
     non_json_limit: int = 50,
 ) -> AsyncIterator[T]:
     """Parse a JSON-lines byte stream and yield parsed events."""
 
+    non_json = stats.non_json_lines
+    # Remaining capture slots, tracked locally so a stream full of non-JSON
+    # (e.g. a crash dump) doesn't pay a len() per failing line.
+    non_json_room = non_json_limit - len(non_json)
+
     async for raw_line in byte_stream:
-        line = raw_line.decode(errors="replace").strip()
+        # Stay in bytes on the hot path; the parser accepts bytes directly,
+        # so only non-JSON lines (diagnostics) pay for a str decode.
+        line = raw_line.strip()
         if not line:
             continue
 
         try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
-            if len(stats.non_json_lines) < non_json_limit:
-                stats.non_json_lines.append(line)
+            event = _loads(line)
+        except ValueError:
+            if non_json_room > 0:
+                non_json.append(line.decode(errors="replace"))
+                non_json_room -= 1
             continue
 
         if not isinstance(event, dict):
             continue
 
-        for result in parse_event(event, state):
-            stats.emitted_any = True
-            yield result
+        # Once the flag is set there is nothing left to track per item, so the
+        # steady state skips the per-result attribute store. parse_event may
+        # return a lazy generator, so the flag can only be set by observing an
+        # item — not by truth-testing the iterable. (`yield from` would be the
+        # natural forwarding form but isn't allowed in async generators.)
+        if stats.emitted_any:
+            for result in parse_event(event, state):
+                yield result
+        else:
+            for result in parse_event(event, state):
+                stats.emitted_any = True
+                yield result
@@ -20,3 +20,9 @@ class Runner(Protocol):
 
     def cancel(self) -> None:
         ...
+
+    def flush_log(self) -> None:
+        ...
+
+    def close_log(self) -> None:
+        ...
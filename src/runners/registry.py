@@ -7,7 +7,7 @@ implementation. Callers should depend on the `Runner` port.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from src.runners.opencode.config import OpenCodeConfig
 
@@ -15,6 +15,41 @@ if TYPE_CHECKING:
     from src.runners.ports import Runner
 
 
+def _build_claude(
+    working_dir: str,
+    output_dir: Path,
+    session_name: str | None,
+    opencode_config: OpenCodeConfig | None,
+) -> Runner:
+    from src.runners.claude.runner import ClaudeRunner
+
+    return ClaudeRunner(working_dir, output_dir, session_name)
+
+
+def _build_opencode(
+    working_dir: str,
+    output_dir: Path,
+    session_name: str | None,
+    opencode_config: OpenCodeConfig | None,
+) -> Runner:
+    from src.runners.opencode.runner import OpenCodeRunner
+
+    return OpenCodeRunner(
+        working_dir,
+        output_dir,
+        session_name,
+        config=opencode_config,
+    )
+
+
+# Builders import their runner lazily, so registering an engine here doesn't
+# pull in its dependencies until it is actually selected.
+_BUILDERS: dict[str, Callable[..., "Runner"]] = {
+    "claude": _build_claude,
+    "opencode": _build_opencode,
+}
+
+
 def create_runner(
     engine: str,
     *,
@@ -25,18 +60,7 @@ def create_runner(
 ) -> Runner:
     engine = (engine or "").strip().lower()
 
-    if engine == "claude":
-        from src.runners.claude.runner import ClaudeRunner
-        return ClaudeRunner(working_dir, output_dir, session_name)
-
-    if engine == "opencode":
-        from src.runners.opencode.runner import OpenCodeRunner
-
-        return OpenCodeRunner(
-            working_dir,
-            output_dir,
-            session_name,
-            config=opencode_config,
-        )
-
-    raise ValueError(f"Unknown engine: {engine}")
+    builder = _BUILDERS.get(engine)
+    if builder is None:
+        raise ValueError(f"Unknown engine: {engine}")
+    return builder(working_dir, output_dir, session_name, opencode_config)
@@ -3,6 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+from typing import AsyncIterator
+
+
+async def iter_stdout_lines(
+    reader: asyncio.StreamReader, chunk_size: int = 64 * 1024
+) -> AsyncIterator[bytes]:
+    """Yield lines from a stream reader via batched reads.
+
+    ``async for line in reader`` awaits a readline Future per line; for
+    high-rate small-line streams the event-loop round-trips dominate. Reading
+    in chunks and splitting locally amortizes that cost, and read() is not
+    subject to the reader's per-line limit.
+    """
+
+    buf = bytearray()
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            if buf:
+                yield bytes(buf)
+            return
+        buf.extend(chunk)
+        if b"\n" not in chunk:
+            continue
+        lines = buf.split(b"\n")
+        buf = bytearray(lines[-1])
+        for line in lines[:-1]:
+            yield line
 
 
 class SubprocessTransport:
@@ -14,56 +14,220 @@ from __future__ import annotations
 
 import json
 import os
+import re
+from collections import OrderedDict
+
+
+try:
+    import orjson
+
+    def _dumps_sorted(obj: object) -> str:
+        """Serialize a redacted preview with sorted keys (orjson-backed)."""
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ).decode()
+
+except ImportError:
+
+    def _dumps_sorted(obj: object) -> str:
+        """Serialize a redacted preview with sorted keys (stdlib fallback)."""
+        return json.dumps(obj, ensure_ascii=False, sort_keys=True, default=str)
 
 
 _REDACT_KEYS = ("key", "token", "secret", "password", "auth", "cookie")
+# One C-level scan per key instead of a Python loop of substring checks.
+_REDACT_RE = re.compile("|".join(map(re.escape, _REDACT_KEYS)), re.IGNORECASE)
+
+try:
+    # For the current 6-key list the regex alternation is a single C pass, but
+    # an Aho-Corasick automaton stays O(len(key)) no matter how large the
+    # redact list grows. Use it when pyahocorasick is around.
+    import ahocorasick
+
+    _REDACT_AUTOMATON = ahocorasick.Automaton()
+    for _k in _REDACT_KEYS:
+        _REDACT_AUTOMATON.add_word(_k, _k)
+    _REDACT_AUTOMATON.make_automaton()
+
+    def _is_sensitive_key(key: str) -> bool:
+        return next(_REDACT_AUTOMATON.iter(key.lower()), None) is not None
+
+except ImportError:
+
+    def _is_sensitive_key(key: str) -> bool:
+        return _REDACT_RE.search(key) is not None
+
+
+# These gates fire once per tool event and the env doesn't change at runtime,
+# so parse them once at import into module constants; the accessors below are
+# plain returns kept for API compatibility.
+_SHOULD_LOG_TOOL_INPUT = os.getenv("SWITCH_LOG_TOOL_INPUT", "").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+_TOOL_INPUT_MAX_LEN = int(os.getenv("SWITCH_LOG_TOOL_INPUT_MAX", "2000"))
 
 
 def should_log_tool_input() -> bool:
-    return os.getenv("SWITCH_LOG_TOOL_INPUT", "").lower() in {"1", "true", "yes"}
+    return _SHOULD_LOG_TOOL_INPUT
 
 
 def tool_input_max_len() -> int:
-    return int(os.getenv("SWITCH_LOG_TOOL_INPUT_MAX", "2000"))
+    return _TOOL_INPUT_MAX_LEN
+
+
+def reload_tool_logging_config() -> None:
+    """Re-read the env gates; useful after changing the env in-process."""
+    global _SHOULD_LOG_TOOL_INPUT, _TOOL_INPUT_MAX_LEN
+    _SHOULD_LOG_TOOL_INPUT = os.getenv("SWITCH_LOG_TOOL_INPUT", "").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    _TOOL_INPUT_MAX_LEN = int(os.getenv("SWITCH_LOG_TOOL_INPUT_MAX", "2000"))
 
 
-def redact_tool_input(obj: object) -> object:
+# Previews are truncated to ~tool_input_max_len() chars downstream, so there
+# is no point walking (or copying) pathological payloads in full.
+_REDACT_MAX_DEPTH = 32
+_REDACT_MAX_ITEMS = 2048
+
+
+def _needs_redact(obj: object, _depth: int = 0, _budget: list[int] | None = None) -> bool:
+    """Report whether a copy pass would change ``obj`` at all.
+
+    True when any key matches the redact set or when the payload exceeds the
+    depth/item caps (so the copy pass gets to truncate it).
+    """
+    if _budget is None:
+        _budget = [_REDACT_MAX_ITEMS]
+    if _depth > _REDACT_MAX_DEPTH:
+        return True
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if _budget[0] <= 0:
+                return True
+            _budget[0] -= 1
+            if _is_sensitive_key(k if isinstance(k, str) else str(k)):
+                return True
+            if _needs_redact(v, _depth + 1, _budget):
+                return True
+        return False
+    if isinstance(obj, list):
+        for x in obj:
+            if _budget[0] <= 0:
+                return True
+            _budget[0] -= 1
+            if _needs_redact(x, _depth + 1, _budget):
+                return True
+        return False
+    return False
+
+
+def redact_tool_input(
+    obj: object, _depth: int = 0, _budget: list[int] | None = None
+) -> object:
+    if _budget is None:
+        # Most tool inputs contain nothing sensitive; an allocation-free
+        # pre-check walk lets those skip the deep copy entirely.
+        if not _needs_redact(obj):
+            return obj
+        _budget = [_REDACT_MAX_ITEMS]
+    if _depth > _REDACT_MAX_DEPTH:
+        return "[TRUNCATED:depth]"
     if isinstance(obj, dict):
         out: dict[object, object] = {}
         for k, v in obj.items():
-            ks = str(k).lower()
-            if any(rk in ks for rk in _REDACT_KEYS):
+            if _budget[0] <= 0:
+                out["..."] = "[TRUNCATED:size]"
+                break
+            _budget[0] -= 1
+            if _is_sensitive_key(k if isinstance(k, str) else str(k)):
                 out[k] = "[REDACTED]"
             else:
-                out[k] = redact_tool_input(v)
+                out[k] = redact_tool_input(v, _depth + 1, _budget)
         return out
     if isinstance(obj, list):
-        return [redact_tool_input(x) for x in obj]
+        items: list[object] = []
+        for x in obj:
+            if _budget[0] <= 0:
+                items.append("[TRUNCATED:size]")
+                break
+            _budget[0] -= 1
+            items.append(redact_tool_input(x, _depth + 1, _budget))
+        return items
     return obj
 
 
-def format_tool_input_preview(tool: str, raw_input: object) -> str | None:
-    """Return a short, human-readable tool input preview (redacted if needed)."""
+def _bash_preview(raw_input: dict) -> str | None:
+    cmd = raw_input.get("command")
+    if isinstance(cmd, str) and cmd.strip():
+        return cmd.strip()
+    return None
 
-    if raw_input is None:
-        return None
 
-    if tool == "bash" and isinstance(raw_input, dict):
-        cmd = raw_input.get("command")
-        if isinstance(cmd, str) and cmd.strip():
-            return cmd.strip()
+def _file_preview(raw_input: dict) -> str | None:
+    fp = raw_input.get("filePath") or raw_input.get("file_path")
+    if isinstance(fp, str) and fp:
+        return fp
+    return None
 
-    if tool in {"read", "write", "edit"} and isinstance(raw_input, dict):
-        fp = raw_input.get("filePath") or raw_input.get("file_path")
-        if isinstance(fp, str) and fp:
-            return fp
 
-    if tool == "grep" and isinstance(raw_input, dict):
-        pat = raw_input.get("pattern")
+def _grep_preview(raw_input: dict) -> str | None:
+    pat = raw_input.get("pattern")
+    if isinstance(pat, str) and pat:
         inc = raw_input.get("include")
-        if isinstance(pat, str) and pat:
-            suffix = f" include={inc!r}" if isinstance(inc, str) and inc else ""
-            return f"pattern={pat!r}" + suffix
+        suffix = f" include={inc!r}" if isinstance(inc, str) and inc else ""
+        return f"pattern={pat!r}" + suffix
+    return None
+
+
+_PREVIEW_EXTRACTORS = {
+    "bash": _bash_preview,
+    "read": _file_preview,
+    "write": _file_preview,
+    "edit": _file_preview,
+    "grep": _grep_preview,
+}
+
+
+# The same parsed tool_input dict is often previewed more than once per event
+# (progress title plus input logging), so memoize by identity. Entries keep a
+# strong reference to the input object, which both pins its id() against reuse
+# and lets a hit verify it still refers to the same object. Inputs come from
+# parsed JSON and are never mutated after parsing.
+_PREVIEW_CACHE: OrderedDict[tuple[str, int], tuple[object, str | None]] = OrderedDict()
+_PREVIEW_CACHE_MAX = 128
+
+
+def format_tool_input_preview(tool: str, raw_input: object) -> str | None:
+    """Return a short, human-readable tool input preview (redacted if needed)."""
+
+    if raw_input is None:
+        return None
 
-    redacted = redact_tool_input(raw_input)
-    return json.dumps(redacted, ensure_ascii=True, sort_keys=True, default=str)
+    cache_key: tuple[str, int] | None = None
+    if isinstance(raw_input, (dict, list)):
+        cache_key = (tool, id(raw_input))
+        hit = _PREVIEW_CACHE.get(cache_key)
+        if hit is not None and hit[0] is raw_input:
+            _PREVIEW_CACHE.move_to_end(cache_key)
+            return hit[1]
+
+    preview: str | None = None
+    if isinstance(raw_input, dict):
+        extractor = _PREVIEW_EXTRACTORS.get(tool)
+        if extractor is not None:
+            preview = extractor(raw_input)
+
+    if preview is None:
+        preview = _dumps_sorted(redact_tool_input(raw_input))
+
+    if cache_key is not None:
+        _PREVIEW_CACHE[cache_key] = (raw_input, preview)
+        if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_MAX:
+            _PREVIEW_CACHE.popitem(last=False)
+    return preview
@@ -4,6 +4,7 @@ Shared utilities for XMPP bridge components.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -305,6 +306,35 @@ def get_xmpp_config() -> dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def get_dispatchers() -> dict[str, dict]:
+    """Parsed dispatcher config, cached for the process lifetime.
+
+    CLI tools look dispatchers up repeatedly (resolution + "known" listing);
+    this avoids re-deriving the whole XMPP config each time.
+    """
+
+    return get_xmpp_config().get("dispatchers") or {}
+
+
+def maybe_install_uvloop() -> bool:
+    """Install uvloop as the event loop policy when available.
+
+    The bridge's hot paths (SSE reads, subprocess pipes, XMPP sockets) are all
+    event-loop bound, where uvloop gives a sizeable speedup. uvloop is an
+    optional, POSIX-only dependency; opt out with SWITCH_USE_UVLOOP=0.
+    """
+
+    if os.getenv("SWITCH_USE_UVLOOP", "1").lower() in {"0", "false", "no"}:
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
 # =============================================================================
 # Ejabberd Commands
 # =============================================================================
@@ -405,6 +435,22 @@ class BaseXMPPBot(ClientXMPP):
 
         msg.send()
 
+    async def drain_sends(self, timeout: float = 2.0) -> None:
+        """Wait until queued outbound stanzas have been written to the stream.
+
+        Bounded by ``timeout`` so a stalled stream can't hang callers that
+        just want to disconnect after a final send.
+        """
+
+        queue = getattr(self, "waiting_queue", None)
+        if queue is None:
+            await asyncio.sleep(0.1)
+            return
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     def send_typing(self, recipient: str | None = None):
         """Send composing (typing) indicator."""
         to = recipient or self.recipient